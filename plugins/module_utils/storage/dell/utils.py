@@ -12,11 +12,28 @@ __metaclass__ = type
 try:
     import PyPowerStore
     from PyPowerStore import powerstore_conn
+    from PyPowerStore import client as py4ps_client
     from PyPowerStore.utils.exception import PowerStoreException
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_Py4PS = True
 except ImportError:
     HAS_Py4PS = False
 
+'''
+check if a faster JSON parser is available
+'''
+try:
+    import orjson
+    FAST_JSON_LOADS = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        FAST_JSON_LOADS = ujson.loads
+    except ImportError:
+        FAST_JSON_LOADS = None
+
 '''
 check if pkg_resources can be imported or not
 '''
@@ -26,8 +43,14 @@ try:
 except ImportError:
     PKG_RSRC_IMPORTED = False
 
+import errno
+import hashlib
+import json
 import logging
 import math
+import os
+import tempfile
+import time
 from decimal import Decimal
 from uuid import UUID
 from datetime import datetime
@@ -35,6 +58,19 @@ from datetime import datetime
 # Application type
 APPLICATION_TYPE = 'Ansible/3.4.0'
 
+# Size of the connection pool of the requests session
+POOL_MAXSIZE = 10
+
+# Transient failures retried by the requests session. POST is left out as
+# creating a resource is not idempotent, it is only retried when the
+# connection could not be established.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(['GET', 'PUT', 'PATCH', 'DELETE'])
+
+# Directory holding the cached GET responses
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.ansible', 'tmp',
+                         'powerstore_cache')
+
 '''
 Check required libraries
 '''
@@ -120,6 +156,110 @@ def get_powerstore_connection(module_params, application_type=APPLICATION_TYPE,
         return conn
 
 
+class SessionRequests(object):
+    """Stand-in for the requests module used by the PyPowerStore client,
+    routing every REST call through a single pooled session"""
+
+    def __init__(self, session, json_loads=None):
+        self.session = session
+        self.json_loads = json_loads
+
+    def request(self, method, url, **kwargs):
+        response = self.session.request(method, url, **kwargs)
+        if self.json_loads:
+            content = response.content
+            response.json = lambda **json_kwargs: self.json_loads(content)
+        return response
+
+
+def get_powerstore_session(application_type=APPLICATION_TYPE,
+                           pool_connections=4, pool_maxsize=POOL_MAXSIZE,
+                           fast_json=False, retry_total=0, retry_backoff=0.5):
+    """Make the PyPowerStore client reuse one keep-alive requests session
+    so that consecutive REST calls do not repeat the TCP/TLS handshake.
+    Transient failures are retried up to retry_total times with an
+    exponential backoff of retry_backoff seconds. With fast_json, responses
+    are parsed with orjson or ujson when one of them is installed.
+    Returns the session, which the caller has to close with
+    close_powerstore_session."""
+    if HAS_Py4PS:
+        retry_args = dict(total=retry_total, backoff_factor=retry_backoff,
+                          status_forcelist=RETRY_STATUS_CODES,
+                          raise_on_status=False)
+        try:
+            retry = Retry(allowed_methods=RETRY_METHODS, **retry_args)
+        except TypeError:
+            # urllib3 older than 1.26
+            retry = Retry(method_whitelist=RETRY_METHODS, **retry_args)
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive',
+                                'User-Agent': application_type})
+        json_loads = FAST_JSON_LOADS if fast_json else None
+        py4ps_client.requests = SessionRequests(session, json_loads)
+        return session
+
+
+def close_powerstore_session(session):
+    """Close the session made by get_powerstore_session and point the
+    PyPowerStore client back at the requests module"""
+    if session:
+        session.close()
+    if HAS_Py4PS:
+        py4ps_client.requests = requests
+
+
+def get_cache_file(array_ip, key, cache_dir=None):
+    """Path of the file caching the response stored under key for the
+    given array"""
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, array_ip, digest + '.json')
+
+
+def read_cache(cache_file, ttl):
+    """Return the cached response if it is younger than ttl seconds"""
+    try:
+        if ttl and time.time() - os.path.getmtime(cache_file) < ttl:
+            with open(cache_file) as cache_fd:
+                return json.load(cache_fd)
+    except (IOError, OSError, ValueError):
+        pass
+    return None
+
+
+def write_cache(cache_file, response):
+    """Store the response in the cache file, errors are ignored"""
+    tmp_file = None
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        try:
+            os.makedirs(cache_dir, 0o700)
+        except OSError as e:
+            # Another run may have created it concurrently
+            if e.errno != errno.EEXIST:
+                raise
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'w') as cache_fd:
+            json.dump(response, cache_fd)
+        os.rename(tmp_file, cache_file)
+    except (IOError, OSError, TypeError, ValueError):
+        if tmp_file:
+            remove_cache(tmp_file)
+
+
+def remove_cache(cache_file):
+    """Invalidate a cached response"""
+    try:
+        os.remove(cache_file)
+    except (IOError, OSError):
+        pass
+
+
 def name_or_id(val):
     """Determines if the input value is a name or id"""
     try:
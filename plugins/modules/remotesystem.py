@@ -26,6 +26,8 @@ options:
     - Name of the remote system.
     - Parameter I(remote_name) cannot be mentioned during addition of a new
       remote system.
+    - If neither I(remote_id) nor I(remote_address) is passed, the remote
+      system is looked up by I(remote_name).
     type: str
   remote_id:
     description:
@@ -81,6 +83,102 @@ options:
     type: bool
     choices: [true, false]
     default: false
+  remote_systems:
+    description:
+    - List of remote systems on which the operation given by I(state) is
+      performed in a single task.
+    - All the remote systems share one connection to the PowerStore array and
+      are looked up concurrently.
+    - Parameter I(remote_systems) is mutually exclusive with all the options
+      it takes as suboptions, such as I(remote_id) or I(description).
+    type: list
+    elements: dict
+    version_added: '3.6.0'
+    suboptions:
+      remote_name:
+        description:
+        - Name of the remote system.
+        type: str
+      remote_id:
+        description:
+        - ID of the remote system.
+        - Parameter I(remote_id) and I(remote_address) are mutually exclusive.
+        type: str
+      remote_user:
+        description:
+        - Username used in basic authentication to remote PowerStore cluster.
+        type: str
+      remote_password:
+        description:
+        - Password used in basic authentication to remote PowerStore cluster.
+        type: str
+      remote_address:
+        description:
+        - Management IP of the remote system.
+        - Parameter I(remote_id) and I(remote_address) are mutually exclusive.
+        type: str
+      new_remote_address:
+        description:
+        - New management IP of the remote system.
+        type: str
+      remote_port:
+        description:
+        - Remote system's port number.
+        type: int
+        default: 443
+      description:
+        description:
+        - Additional information about the remote system.
+        type: str
+      network_latency:
+        description:
+        - Replication traffic can be tuned for higher efficiency depending on
+          the expected network latency.
+        type: str
+        choices: [Low, High]
+  cache_ttl:
+    description:
+    - Number of seconds for which the remote system details fetched by a
+      previous task are reused instead of being queried again.
+    - The details are cached under C(~/.ansible/tmp/powerstore_cache) on the
+      host that runs the module.
+    - The cached details are removed when the remote system is modified or
+      deleted.
+    - The cached details decide whether the remote system is created,
+      modified or deleted, so a change done outside of this module may be
+      missed until they expire.
+    - Setting to C(0) disables the cache.
+    type: int
+    default: 0
+    version_added: '3.6.0'
+  fast_json:
+    description:
+    - Whether to parse the responses of the PowerStore array with C(orjson)
+      or C(ujson) instead of the standard C(json) library.
+    - It has effect only if one of these libraries is installed on the host
+      that runs the module.
+    type: bool
+    default: false
+    version_added: '3.6.0'
+  retry_total:
+    description:
+    - Number of times a request to the PowerStore array is retried after a
+      connection error.
+    - Get, modify and delete requests are also retried after a read error
+      or a C(429), C(500), C(502), C(503) or C(504) response. Create
+      requests are not, as they are not idempotent.
+    - Each retry may wait up to I(timeout) seconds.
+    - Setting to C(0) disables the retries.
+    type: int
+    default: 0
+    version_added: '3.6.0'
+  retry_backoff:
+    description:
+    - Backoff factor in seconds between the retries of a request.
+    - The wait before the nth retry is I(retry_backoff) * 2^(n-1) seconds.
+    type: float
+    default: 0.5
+    version_added: '3.6.0'
   state:
     description:
     - The state of the remote system after the task is performed.
@@ -151,6 +249,19 @@ EXAMPLES = r'''
     password: "{{password}}"
     remote_id: "D7d7e7917-735b-3eef-8cc3-1302001c08e7"
     state: "absent"
+
+- name: Modify network latency of multiple remote systems
+  dellemc.powerstore.remotesystem:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    remote_systems:
+      - remote_address: "xxx.xxx.xxx.xxx"
+        network_latency: "High"
+      - remote_id: "7d7e7917-735b-3eef-8cc3-1302001c08e7"
+        network_latency: "High"
+    state: "present"
 '''
 
 RETURN = r'''
@@ -291,8 +402,21 @@ remote_system_details:
         "type_l10n": "PowerStore",
         "user_name": ""
     }
+
+results:
+    description:
+        - Result of the operation on each remote system passed in
+          I(remote_systems), in the same order.
+        - Each entry has the keys C(changed), C(job_details) and
+          C(remote_system_details) as returned for a single remote system.
+    returned: When remote_systems is passed.
+    type: list
+    elements: dict
+    version_added: '3.6.0'
 '''
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
@@ -307,39 +431,37 @@ py4ps_version = utils.py4ps_version_check()
 IS_SUPPORTED_PY4PS_VERSION = py4ps_version['supported_version']
 VERSION_ERROR = py4ps_version['unsupported_version_message']
 
+PY4PS_ERROR = None
+if HAS_PY4PS is False:
+    PY4PS_ERROR = IMPORT_ERROR
+elif IS_SUPPORTED_PY4PS_VERSION is False:
+    PY4PS_ERROR = VERSION_ERROR
+
 
 class PowerstoreRemoteSystem(object):
     """Remote system operations"""
-    cluster_name = ' '
-    cluster_global_id = ' '
 
     def __init__(self):
         """Define all the parameters required by this module"""
-        self.module_params = utils.get_powerstore_management_host_parameters()
-        self.module_params.update(get_powerstore_remote_system_parameters())
-
         # initialize the Ansible module
-        mut_ex_args = [['remote_id', 'remote_address']]
-        # in case of create remote address and remote port may also be needed.
-        # These operation specific parameters validation will be done separately.
-        required_together = [['remote_user', 'remote_password']]
         self.module = AnsibleModule(
-            argument_spec=self.module_params,
+            argument_spec=ARGUMENT_SPEC,
             supports_check_mode=False,
-            mutually_exclusive=mut_ex_args,
-            required_together=required_together
+            mutually_exclusive=MUTUALLY_EXCLUSIVE,
+            required_together=REQUIRED_TOGETHER
         )
-        LOG.info('HAS_PY4PS = %s , IMPORT_ERROR = %s', HAS_PY4PS,
-                 IMPORT_ERROR)
-        if HAS_PY4PS is False:
-            self.module.fail_json(msg=IMPORT_ERROR)
-        LOG.info('IS_SUPPORTED_PY4PS_VERSION = %s , VERSION_ERROR = '
-                 '%s', IS_SUPPORTED_PY4PS_VERSION, VERSION_ERROR)
-        if IS_SUPPORTED_PY4PS_VERSION is False:
-            self.module.fail_json(msg=VERSION_ERROR)
+        if PY4PS_ERROR:
+            LOG.debug('PyPowerStore check failed: %s', PY4PS_ERROR)
+            self.module.fail_json(msg=PY4PS_ERROR)
 
+        # results of the remote systems of a batch processed so far
+        self.results = None
         self.conn = utils.get_powerstore_connection(
             self.module.params)
+        self.session = utils.get_powerstore_session(
+            fast_json=self.module.params['fast_json'],
+            retry_total=self.module.params['retry_total'],
+            retry_backoff=self.module.params['retry_backoff'])
         self.provisioning = self.conn.provisioning
         LOG.info('Got Py4ps instance for provisioning on PowerStore %s',
                  self.provisioning)
@@ -350,13 +472,100 @@ class PowerstoreRemoteSystem(object):
         LOG.info('Got Py4ps instance for configuration on PowerStore %s',
                  self.configuration)
 
+    def get_cache_file(self, remote_sys_name=None, remote_sys_address=None,
+                       remote_sys_id=None):
+        """Get the cache file of a remote system lookup"""
+        if remote_sys_address:
+            key = 'remote_system/address/' + remote_sys_address
+        elif remote_sys_id:
+            key = 'remote_system/id/' + remote_sys_id
+        else:
+            key = 'remote_system/name/' + str(remote_sys_name)
+        key = '{0}:{1}/{2}'.format(self.module.params['user'],
+                                   self.module.params['port'], key)
+        return utils.get_cache_file(self.module.params['array_ip'], key)
+
+    def invalidate_cache(self, remote_sys_details):
+        """Remove every cached lookup of the given remote system"""
+        for lookup in ({'remote_sys_address':
+                        remote_sys_details['management_address']},
+                       {'remote_sys_id': remote_sys_details['id']},
+                       {'remote_sys_name': remote_sys_details['name']}):
+            utils.remove_cache(self.get_cache_file(**lookup))
+
     def get_remote_system_details(self, remote_sys_name=None,
                                   remote_sys_address=None, remote_sys_id=None):
-        """Get remote system details by name or id"""
+        """Get remote system details by name, address or id"""
+        try:
+            return self.get_cached_remote_system_details(
+                remote_sys_name, remote_sys_address, remote_sys_id)
+        except Exception as e:
+            self.fail_remote_system_lookup(remote_sys_name, remote_sys_id, e)
+
+    def login(self):
+        """Log in to the PowerStore array, the token and cookie are then
+        reused by the following requests"""
+        try:
+            auth_manager = self.provisioning.client.auth_manager
+            auth_manager.set_host(self.provisioning.server_ip)
+            auth_manager.get_token_and_cookie()
+        except Exception as e:
+            msg = 'Login to PowerStore array failed with error {0}'.format(e)
+            LOG.error(msg)
+            self.fail_module(msg, **utils.failure_codes(e))
+
+    def fail_module(self, msg, **kwargs):
+        """Fail the module, reporting the remote systems of the batch
+        which were already processed"""
+        if self.results:
+            kwargs.update(
+                changed=any(result['changed'] for result in self.results),
+                results=self.results)
+        self.module.fail_json(msg=msg, **kwargs)
+
+    def fail_remote_system_lookup(self, remote_sys_name, remote_sys_id, e):
+        """Fail the module for an error raised by a remote system lookup"""
+        msg = 'Get details of remote system name: {0} or ID {1}' \
+              'failed with' \
+              ' error : {2} '.format(remote_sys_name, remote_sys_id, e)
+        LOG.error(msg)
+        self.fail_module(msg, **utils.failure_codes(e))
+
+    def get_cached_remote_system_details(self, remote_sys_name=None,
+                                         remote_sys_address=None,
+                                         remote_sys_id=None):
+        """Get remote system details by name, address or id, served from
+        the cache while it is younger than cache_ttl seconds. Errors other
+        than a missing remote system are raised."""
+        cache_ttl = self.module.params['cache_ttl']
+        if not cache_ttl:
+            return self.fetch_remote_system_details(
+                remote_sys_name, remote_sys_address, remote_sys_id)
+
+        cache_file = self.get_cache_file(
+            remote_sys_name, remote_sys_address, remote_sys_id)
+        remote_sys_details = utils.read_cache(cache_file, cache_ttl)
+        if remote_sys_details:
+            LOG.info('Got the details of remote system from cache file %s',
+                     cache_file)
+            return remote_sys_details
+
+        remote_sys_details = self.fetch_remote_system_details(
+            remote_sys_name, remote_sys_address, remote_sys_id)
+        if remote_sys_details:
+            utils.write_cache(cache_file, remote_sys_details)
+        return remote_sys_details
+
+    def fetch_remote_system_details(self, remote_sys_name=None,
+                                    remote_sys_address=None,
+                                    remote_sys_id=None):
+        """Get remote system details from the PowerStore array. Errors
+        other than a missing remote system are raised."""
         try:
             LOG.info('Getting the details of remote system, Name:%s ,'
                      'address:%s, ID:%s', remote_sys_name,
                      remote_sys_address, remote_sys_id)
+            resp = None
             if remote_sys_address:
                 resp = \
                     self.protection.\
@@ -367,31 +576,34 @@ class PowerstoreRemoteSystem(object):
                              'with address: %s', remote_sys_address)
                     return resp[0]
 
-            else:
+            elif remote_sys_id:
                 resp = self.protection.get_remote_system_details(
                     remote_sys_id)
                 if resp:
-                    LOG.info('Successfully got the details of replication '
-                             'rule with id: %s', remote_sys_id)
+                    LOG.info('Successfully got the details of remote '
+                             'system with id: %s', remote_sys_id)
                     return resp
 
-            msg = 'No remote system present with name {0} or ID {1}'.format(
-                remote_sys_name, remote_sys_id)
-            LOG.info(msg)
-            return resp
+            elif remote_sys_name:
+                resp = self.protection.get_remote_system_by_name(
+                    remote_sys_name)
+                if resp:
+                    LOG.info('Successfully got the details of remote system '
+                             'with name: %s', remote_sys_name)
+                    return resp[0]
+
+            LOG.info('No remote system present with name %s or ID %s',
+                     remote_sys_name, remote_sys_id)
+            return None
 
         except Exception as e:
-            msg = 'Get details of remote system name: {0} or ID {1}' \
-                  'failed with' \
-                  ' error : {2} '.format(remote_sys_name, remote_sys_id,
-                                         str(e))
             if isinstance(e, utils.PowerStoreException) and \
                     e.err_code == utils.PowerStoreException.HTTP_ERR and \
                     e.status_code == "404":
-                LOG.info(msg)
+                LOG.info('Remote system name: %s or ID %s not found: %s',
+                         remote_sys_name, remote_sys_id, e)
                 return None
-            LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            raise
 
     def exchange_certificates(self, remote_user, remote_password,
                               remote_address, remote_port):
@@ -413,9 +625,9 @@ class PowerstoreRemoteSystem(object):
 
         except Exception as e:
             msg = 'Exchange certificate on PowerStore array ' \
-                  'failed with error {0}'.format(str(e))
+                  'failed with error {0}'.format(e)
             LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self.fail_module(msg, **utils.failure_codes(e))
 
     def create_remote_system(self, remote_address=None, description=None,
                              network_latency=None):
@@ -427,21 +639,24 @@ class PowerstoreRemoteSystem(object):
                 'description': description,
                 'data_network_latency': network_latency
             }
-            resp = self.protection.create_remote_system(
+            # PyPowerStore already returns the details of the created remote
+            # system. Query them only if the response carries just the id.
+            remote_sys_details = self.protection.create_remote_system(
                 create_remote_sys_dict)
-
-            remote_sys_details = \
-                self.protection.get_remote_system_details(resp.get('id'))
+            if 'management_address' not in remote_sys_details:
+                remote_sys_details = \
+                    self.protection.get_remote_system_details(
+                        remote_sys_details.get('id'))
             LOG.info(
                 'Successfully created remote system, id: %s'
-                ' on PowerStore array', resp.get("id"))
+                ' on PowerStore array', remote_sys_details.get("id"))
             return True, remote_sys_details
 
         except Exception as e:
             msg = 'create remote system failed with error ' \
-                  '{0}'.format(str(e))
+                  '{0}'.format(e)
             LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self.fail_module(msg, **utils.failure_codes(e))
 
     def modify_remote_system(self, remote_sys_id, modify_dict, is_async):
         """ Modify an existing remote system of a given PowerStore storage
@@ -458,9 +673,9 @@ class PowerstoreRemoteSystem(object):
 
         except Exception as e:
             msg = 'Modify remote system id: {0} failed with error ' \
-                  '{1}'.format(remote_sys_id, str(e))
+                  '{1}'.format(remote_sys_id, e)
             LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self.fail_module(msg, **utils.failure_codes(e))
 
     def delete_remote_system(self, remote_sys_id, is_async):
         """ Delete a remote system by id of a given PowerStore storage
@@ -477,33 +692,13 @@ class PowerstoreRemoteSystem(object):
 
         except Exception as e:
             msg = 'Delete remote system with id: {0} failed with error ' \
-                  '{1} '.format(remote_sys_id, str(e))
+                  '{1} '.format(remote_sys_id, e)
             LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
-
-    def get_clusters(self):
-        """Get the clusters"""
-        try:
-            clusters = self.provisioning.get_cluster_list()
-            return clusters
-
-        except Exception as e:
-            msg = 'Failed to get the clusters with ' \
-                  'error {0}'.format(str(e))
-            LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self.fail_module(msg, **utils.failure_codes(e))
 
     def perform_module_operation(self):
         """collect input"""
-        remote_sys_user = self.module.params['remote_user']
-        remote_sys_password = self.module.params['remote_password']
-        remote_sys_port = self.module.params['remote_port']
-        remote_sys_name = self.module.params['remote_name']
-        remote_sys_id = self.module.params['remote_id']
-        remote_sys_address = self.module.params['remote_address']
-        new_remote_sys_address = self.module.params['new_remote_address']
-        description = self.module.params['description']
-        network_latency = self.module.params['network_latency']
+        remote_systems = self.module.params['remote_systems']
         wait_for_completion = self.module.params['wait_for_completion']
         state = self.module.params['state']
 
@@ -512,36 +707,84 @@ class PowerstoreRemoteSystem(object):
         if wait_for_completion is not None:
             is_async = not wait_for_completion
 
-        result = dict()
+        if remote_systems is None:
+            remote_sys_details = self.get_remote_system_details(
+                self.module.params['remote_name'],
+                self.module.params['remote_address'],
+                self.module.params['remote_id'])
+            result = self.perform_remote_system_operation(
+                self.module.params, state, is_async, remote_sys_details)
+            self.module.exit_json(**result)
+        else:
+            self.perform_batch_operation(remote_systems, state, is_async)
+
+    def perform_batch_operation(self, remote_systems, state, is_async):
+        """Perform the operation on every remote system of the batch"""
+        # Get the details of all the remote systems of the batch
+        # concurrently over the pooled session. The SDK is logged in
+        # beforehand so that the workers do not race to log in. The workers
+        # return their errors, the module is failed from this thread only.
+        self.login()
+        with ThreadPoolExecutor(max_workers=utils.POOL_MAXSIZE) as executor:
+            lookups = list(executor.map(
+                self.get_batch_remote_system_details, remote_systems))
+
+        for remote_sys_params, (remote_sys_details, error) in zip(
+                remote_systems, lookups):
+            if error:
+                self.fail_remote_system_lookup(
+                    remote_sys_params['remote_name'],
+                    remote_sys_params['remote_id'], error)
+
+        # Validate every entry before the first one changes the array
+        for remote_sys_params, (remote_sys_details, error) in zip(
+                remote_systems, lookups):
+            msg = get_remote_system_params_error(
+                remote_sys_params, state, remote_sys_details)
+            if msg:
+                self.fail_module(msg)
+
+        self.results = []
+        for remote_sys_params, (remote_sys_details, error) in zip(
+                remote_systems, lookups):
+            self.results.append(self.perform_remote_system_operation(
+                remote_sys_params, state, is_async, remote_sys_details))
+
+        self.module.exit_json(
+            changed=any(result['changed'] for result in self.results),
+            results=self.results)
+
+    def get_batch_remote_system_details(self, remote_sys_params):
+        """Get the details of a remote system of the batch, returned along
+        with the error raised by the lookup"""
+        try:
+            return self.get_cached_remote_system_details(
+                remote_sys_params['remote_name'],
+                remote_sys_params['remote_address'],
+                remote_sys_params['remote_id']), None
+        except Exception as e:
+            return None, e
+
+    def perform_remote_system_operation(self, params, state, is_async,
+                                        remote_sys_details):
+        """Create, modify or delete a single remote system, given its
+        details fetched beforehand (None when it does not exist)"""
+        # name, id and address get completed from the fetched details
+        remote_sys_name = params['remote_name']
+        remote_sys_id = params['remote_id']
+        remote_sys_address = params['remote_address']
+
         changed = False
         job_id = None
 
-        # Get the cluster details
-        clusters = self.get_clusters()
-        if len(clusters) > 0:
-            self.cluster_name = clusters[0]['name']
-            self.cluster_global_id = clusters[0]['id']
-        else:
-            msg = "Unable to find any active cluster on this array"
-            LOG.error(msg)
-            self.module.fail_json(msg=msg)
+        msg = get_remote_system_params_error(
+            params, state, remote_sys_details)
+        if msg:
+            self.fail_module(msg)
 
-        if remote_sys_name and not remote_sys_address and not remote_sys_id:
-            self.module.fail_json(
-                msg="With remote_name, remote_address or remote_id"
-                    " is required to perform Get/Update/Delete.")
-
-        # Get the details of the remote system
-        remote_sys_details = self.get_remote_system_details(
-            remote_sys_name, remote_sys_address, remote_sys_id)
         if remote_sys_details:
             if not remote_sys_id:
                 remote_sys_id = remote_sys_details['id']
-            if remote_sys_name and \
-                    remote_sys_name != remote_sys_details['name']:
-                self.module.fail_json(
-                    msg="Please enter a valid remote_name. It is not matching the"
-                        " fetched remote system instance")
             if not remote_sys_name:
                 remote_sys_name = remote_sys_details['name']
                 if not remote_sys_address:
@@ -550,74 +793,81 @@ class PowerstoreRemoteSystem(object):
 
         # Create a remote system
         if not remote_sys_details and state == "present":
-            if remote_sys_id or remote_sys_name:
-                msg = "remote_id/remote_name cannot be passed" \
-                      " during creation. Please enter valid" \
-                      " parameters for creation of remote system."
-                self.module.fail_json(msg=msg)
-
             # exchange the certificates
             self.exchange_certificates(
-                remote_sys_user, remote_sys_password,
-                remote_sys_address, remote_sys_port)
+                params['remote_user'], params['remote_password'],
+                remote_sys_address, params['remote_port'])
             # creating a remote system after successful
             # exchange of certificates
             changed, remote_sys_details = self.create_remote_system(
-                remote_sys_address, description, network_latency)
+                remote_sys_address, params['description'],
+                params['network_latency'])
             remote_sys_id = remote_sys_details['id']
 
         # Delete a remote system
         if remote_sys_details and state == "absent":
+            self.invalidate_cache(remote_sys_details)
             changed, job_id = self.delete_remote_system(remote_sys_id,
                                                         is_async)
             remote_sys_details = None
 
         # Update the details of remote system
         if remote_sys_details and state == "present":
-            modify_remote_sys_dict = {
-                'management_address': new_remote_sys_address,
-                'description': description,
-                'data_network_latency': network_latency
-            }
-
-            to_modify = modify_remote_system_required(
-                remote_sys_details, modify_remote_sys_dict)
-            LOG.debug("To modify : %s", to_modify)
-
-            if to_modify:
+            modify_remote_sys_dict = get_remote_system_modify_dict(
+                remote_sys_details, {
+                    'management_address': params['new_remote_address'],
+                    'description': params['description'],
+                    'data_network_latency': params['network_latency']
+                })
+
+            if modify_remote_sys_dict:
+                LOG.debug("To modify : %s", modify_remote_sys_dict)
+                self.invalidate_cache(remote_sys_details)
                 changed, resp = \
                     self.modify_remote_system(
                         remote_sys_id, modify_remote_sys_dict, is_async)
                 if is_async:
                     job_id = resp
+                elif isinstance(resp, dict) and resp.get('id'):
+                    remote_sys_details = resp
                 else:
-                    remote_sys_details = self.get_remote_system_details(
-                        remote_sys_id=remote_sys_id)
-
-        result['changed'] = changed
-        result['job_details'] = job_id
-        if not job_id:
-            result['remote_system_details'] = remote_sys_details
-
-        self.module.exit_json(**result)
-
-
-def modify_remote_system_required(remote_sys_details, passed_args):
-    """ To check if modification is required or not"""
-    for key in remote_sys_details.keys():
-        if key in passed_args.keys() and\
-                passed_args[key] is not None and\
-                remote_sys_details[key] != passed_args[key]:
-            LOG.debug("Key %s in remote_sys_details=%s,"
-                      "passed_args=%s", key,
-                      remote_sys_details[key], passed_args[key])
-            return True
-    return False
-
-
-def get_powerstore_remote_system_parameters():
-    """This method provide the parameters required for the remote system
-     operations for PowerStore"""
+                    # The synchronous modify returns no body, so apply the
+                    # requested changes to the already fetched details
+                    # instead of querying the remote system again.
+                    remote_sys_details.update(modify_remote_sys_dict)
+
+        return {
+            'changed': changed,
+            'job_details': job_id,
+            'remote_system_details': None if job_id else remote_sys_details
+        }
+
+
+def get_remote_system_params_error(params, state, remote_sys_details):
+    """ Check the parameters of a remote system against its fetched
+    details, returns the error message if they are invalid"""
+    if remote_sys_details:
+        if params['remote_name'] and \
+                params['remote_name'] != remote_sys_details['name']:
+            return "Please enter a valid remote_name. It is not matching the" \
+                   " fetched remote system instance"
+    elif state == "present" and (params['remote_id'] or params['remote_name']):
+        return "remote_id/remote_name cannot be passed" \
+               " during creation. Please enter valid" \
+               " parameters for creation of remote system."
+    return None
+
+
+def get_remote_system_modify_dict(remote_sys_details, passed_args):
+    """ Get the passed attributes which differ from the remote system
+    details, an empty dict means no modification is required"""
+    return dict((key, val) for key, val in passed_args.items()
+                if val is not None and remote_sys_details.get(key) != val)
+
+
+def get_remote_system_options():
+    """This method provide the parameters identifying a remote system and
+    its attributes"""
 
     return dict(
         remote_id=dict(), remote_name=dict(),
@@ -625,18 +875,49 @@ def get_powerstore_remote_system_parameters():
         remote_address=dict(), new_remote_address=dict(),
         remote_port=dict(default=443, type='int'), description=dict(),
         network_latency=dict(required=False, type='str',
-                             choices=['Low', 'High']),
+                             choices=['Low', 'High'])
+    )
+
+
+def get_powerstore_remote_system_parameters():
+    """This method provide the parameters required for the remote system
+     operations for PowerStore"""
+
+    params = get_remote_system_options()
+    params.update(
+        remote_systems=dict(
+            type='list', elements='dict', options=get_remote_system_options(),
+            mutually_exclusive=[['remote_id', 'remote_address']],
+            required_together=[['remote_user', 'remote_password']]),
         wait_for_completion=dict(required=False, type='bool',
                                  choices=[True, False], default=False),
+        cache_ttl=dict(type='int', default=0),
+        fast_json=dict(type='bool', default=False),
+        retry_total=dict(type='int', default=0),
+        retry_backoff=dict(type='float', default=0.5),
         state=dict(required=True, type='str', choices=['present', 'absent'])
     )
+    return params
+
+
+# The argument spec is built once when the module is loaded.
+ARGUMENT_SPEC = utils.get_powerstore_management_host_parameters()
+ARGUMENT_SPEC.update(get_powerstore_remote_system_parameters())
+MUTUALLY_EXCLUSIVE = (('remote_id', 'remote_address'),) + tuple(
+    ('remote_systems', option) for option in get_remote_system_options())
+# in case of create remote address and remote port may also be needed.
+# These operation specific parameters validation will be done separately.
+REQUIRED_TOGETHER = (('remote_user', 'remote_password'),)
 
 
 def main():
     """ Create PowerStore remote system object and perform action on it
         based on user input from playbook """
     obj = PowerstoreRemoteSystem()
-    obj.perform_module_operation()
+    try:
+        obj.perform_module_operation()
+    finally:
+        utils.close_powerstore_session(obj.session)
 
 
 if __name__ == '__main__':
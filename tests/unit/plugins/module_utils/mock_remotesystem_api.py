@@ -15,6 +15,8 @@ class MockRemoteSystemApi:
     sample_address = "xx.xx.xx.xx"
     REMOTE_SYSTEM_COMMON_ARGS = {
         'array_ip': '**.***.**.***',
+        'user': 'admin',
+        'port': None,
         'remote_id': None,
         'remote_name': None,
         'remote_user': None,
@@ -25,6 +27,11 @@ class MockRemoteSystemApi:
         'remote_port': None,
         'network_latency': None,
         'wait_for_completion': None,
+        'cache_ttl': 0,
+        'fast_json': False,
+        'retry_total': 0,
+        'retry_backoff': 0.5,
+        'remote_systems': None,
         'description': None
     }
 
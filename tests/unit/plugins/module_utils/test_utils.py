@@ -0,0 +1,104 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the requests session and cache helpers of PowerStore utils"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+import errno
+import os
+import pytest
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import utils
+
+requests = pytest.importorskip('requests')
+from requests.adapters import HTTPAdapter  # noqa: E402
+from urllib3.util.retry import Retry  # noqa: E402
+
+
+class TestPowerstoreSession():
+
+    @pytest.fixture
+    def py4ps_client(self, mocker):
+        py4ps_client = MagicMock()
+        mocker.patch.multiple(utils, create=True, HAS_Py4PS=True,
+                              requests=requests, HTTPAdapter=HTTPAdapter,
+                              Retry=Retry, py4ps_client=py4ps_client)
+        return py4ps_client
+
+    def test_get_powerstore_session(self, py4ps_client):
+        session = utils.get_powerstore_session(retry_total=2,
+                                               retry_backoff=0.1)
+        adapter = session.get_adapter('https://xx.xx.xx.xx')
+        assert isinstance(adapter, HTTPAdapter)
+        assert session.get_adapter('http://xx.xx.xx.xx') is adapter
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.backoff_factor == 0.1
+        assert tuple(adapter.max_retries.status_forcelist) == \
+            utils.RETRY_STATUS_CODES
+        assert 'POST' not in utils.RETRY_METHODS
+        assert 'PATCH' in utils.RETRY_METHODS
+        assert isinstance(py4ps_client.requests, utils.SessionRequests)
+        assert py4ps_client.requests.session is session
+        assert py4ps_client.requests.json_loads is None
+
+    def test_get_powerstore_session_old_urllib3(self, py4ps_client, mocker):
+        def old_retry(total, backoff_factor, status_forcelist, raise_on_status,
+                      method_whitelist):
+            return Retry(total=total, backoff_factor=backoff_factor,
+                         status_forcelist=status_forcelist,
+                         raise_on_status=raise_on_status)
+        old_retry = MagicMock(side_effect=old_retry)
+        mocker.patch.object(utils, 'Retry', old_retry)
+        session = utils.get_powerstore_session()
+        assert isinstance(session.get_adapter('https://xx.xx.xx.xx').max_retries, Retry)
+        assert old_retry.call_args[1]['method_whitelist'] == utils.RETRY_METHODS
+
+    def test_close_powerstore_session(self, py4ps_client):
+        session = utils.get_powerstore_session()
+        session.close = MagicMock()
+        utils.close_powerstore_session(session)
+        session.close.assert_called_once()
+        assert py4ps_client.requests is requests
+
+    def test_session_requests_fast_json(self):
+        session = MagicMock()
+        session.request.return_value.content = b'{"id": "1"}'
+        json_loads = MagicMock(return_value={'id': '1'})
+        response = utils.SessionRequests(session, json_loads).request(
+            'GET', 'https://xx.xx.xx.xx', headers={})
+        assert response.json() == {'id': '1'}
+        json_loads.assert_called_once_with(b'{"id": "1"}')
+        session.request.assert_called_once_with(
+            'GET', 'https://xx.xx.xx.xx', headers={})
+
+    def test_session_requests_default_json(self):
+        session = MagicMock()
+        response = utils.SessionRequests(session).request(
+            'GET', 'https://xx.xx.xx.xx')
+        assert response.json is session.request.return_value.json
+
+
+class TestPowerstoreCache():
+
+    def test_write_cache_existing_dir(self, tmp_path):
+        cache_file = utils.get_cache_file('xx.xx.xx.xx', 'key', str(tmp_path))
+        utils.write_cache(cache_file, {'id': '1'})
+        utils.write_cache(cache_file, {'id': '2'})
+        assert utils.read_cache(cache_file, 60) == {'id': '2'}
+
+    def test_write_cache_dir_created_concurrently(self, tmp_path, mocker):
+        cache_file = utils.get_cache_file(
+            'xx.xx.xx.xx', 'key', str(tmp_path / 'cache'))
+        # another run creates the directory after it was found missing
+        os.makedirs(os.path.dirname(cache_file))
+        mocker.patch.object(utils.os.path, 'isdir', return_value=False)
+        mocker.patch.object(utils.os, 'makedirs', side_effect=OSError(
+            errno.EEXIST, os.strerror(errno.EEXIST)))
+        utils.write_cache(cache_file, {'id': '1'})
+        assert utils.read_cache(cache_file, 60) == {'id': '1'}
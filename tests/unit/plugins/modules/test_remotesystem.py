@@ -9,6 +9,8 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import json
+import os
 import pytest
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries import initial_mock
@@ -56,6 +58,111 @@ class TestPowerstoreRemoteSystem():
         assert self.get_module_args['remote_address'] == remotesystem_module_mock.module.exit_json.call_args[1]['remote_system_details']['management_address']
         remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address.assert_called()
 
+    def test_get_remotesystem_remote_name_response(self, remotesystem_module_mock):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_address': None,
+            'remote_name': "XX-1234",
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        remotesystem_module_mock.conn.protection.get_remote_system_by_name = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.perform_module_operation()
+        assert module_args['remote_name'] == remotesystem_module_mock.module.exit_json.call_args[1]['remote_system_details']['name']
+        remotesystem_module_mock.conn.protection.get_remote_system_by_name.assert_called_once()
+
+    def test_get_remotesystem_from_cache(self, remotesystem_module_mock, mocker):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': self.remote_system_sample_address,
+            'cache_ttl': 30,
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        mocker.patch(MockRemoteSystemApi.MODULE_UTILS_PATH + '.read_cache',
+                     return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0])
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        assert remotesystem_module_mock.module.exit_json.call_args[1]['remote_system_details'] == \
+            MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0]
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address.assert_not_called()
+
+    def get_cache_files(self, remotesystem_module_mock):
+        details = MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0]
+        return [remotesystem_module_mock.get_cache_file(remote_sys_address=details['management_address']),
+                remotesystem_module_mock.get_cache_file(remote_sys_id=details['id']),
+                remotesystem_module_mock.get_cache_file(remote_sys_name=details['name'])]
+
+    def write_cache_files(self, remotesystem_module_mock):
+        cache_files = self.get_cache_files(remotesystem_module_mock)
+        for cache_file in cache_files:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as cache_fd:
+                json.dump(MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0], cache_fd)
+        return cache_files
+
+    def test_get_remotesystem_writes_cache(self, remotesystem_module_mock, mocker, tmp_path):
+        mocker.patch(MockRemoteSystemApi.MODULE_UTILS_PATH + '.CACHE_DIR', str(tmp_path))
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': self.remote_system_sample_address,
+            'new_remote_address': None,
+            'description': None,
+            'network_latency': None,
+            'cache_ttl': 30,
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.perform_module_operation()
+        cache_file = self.get_cache_files(remotesystem_module_mock)[0]
+        with open(cache_file) as cache_fd:
+            assert json.load(cache_fd) == MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0]
+
+    def test_modify_remotesystem_invalidates_cache(self, remotesystem_module_mock, mocker, tmp_path):
+        mocker.patch(MockRemoteSystemApi.MODULE_UTILS_PATH + '.CACHE_DIR', str(tmp_path))
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': self.remote_system_sample_address,
+            'new_remote_address': None,
+            'description': None,
+            'network_latency': "High",
+            'cache_ttl': 30,
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        cache_files = self.write_cache_files(remotesystem_module_mock)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.modify_remote_system.assert_called()
+        assert not any(os.path.exists(cache_file) for cache_file in cache_files)
+
+    def test_delete_remotesystem_invalidates_cache(self, remotesystem_module_mock, mocker, tmp_path):
+        mocker.patch(MockRemoteSystemApi.MODULE_UTILS_PATH + '.CACHE_DIR', str(tmp_path))
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': "aaa3cc6b-455b-4bde-aa75-a1edf61bbe0b",
+            'remote_name': None,
+            'remote_address': None,
+            'cache_ttl': 30,
+            'state': "absent"
+        })
+        remotesystem_module_mock.module.params = module_args
+        cache_files = self.write_cache_files(remotesystem_module_mock)
+        remotesystem_module_mock.conn.protection.delete_remote_system = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.delete_remote_system.assert_called()
+        assert not any(os.path.exists(cache_file) for cache_file in cache_files)
+
     def test_get_remotesystem_remote_address_exception(self, remotesystem_module_mock):
         MockApiException.HTTP_ERR = "1"
         MockApiException.err_code = "1"
@@ -82,6 +189,7 @@ class TestPowerstoreRemoteSystem():
             return_value=MockRemoteSystemApi.CLUSTER_DETAILS)
         remotesystem_module_mock.perform_module_operation()
         remotesystem_module_mock.conn.protection.get_remote_system_details.assert_called()
+        remotesystem_module_mock.provisioning.get_cluster_list.assert_not_called()
 
     def test_add_remotesystem_remote_address_response(self, remotesystem_module_mock):
         self.get_module_args.update({
@@ -99,6 +207,27 @@ class TestPowerstoreRemoteSystem():
         remotesystem_module_mock.perform_module_operation()
         remotesystem_module_mock.conn.protection.create_remote_system.assert_called()
 
+    def test_add_remotesystem_without_refetch(self, remotesystem_module_mock):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': self.remote_system_sample_address,
+            'remote_user': "admin",
+            'remote_password': "remote_password",
+            'remote_port': 443,
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=None)
+        remotesystem_module_mock.conn.protection.create_remote_system = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0])
+        remotesystem_module_mock.conn.protection.get_remote_system_details = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.create_remote_system.assert_called()
+        remotesystem_module_mock.conn.protection.get_remote_system_details.assert_not_called()
+
     def test_modify_remotesystem_network_latency(self, remotesystem_module_mock):
         self.get_module_args.update({
             'remote_address': self.remote_system_sample_address,
@@ -115,6 +244,44 @@ class TestPowerstoreRemoteSystem():
         remotesystem_module_mock.perform_module_operation()
         remotesystem_module_mock.conn.protection.modify_remote_system.assert_called()
 
+    def test_modify_remotesystem_sync_without_refetch(self, remotesystem_module_mock):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': "aaa3cc6b-455b-4bde-aa75-a1edf61bbe0b",
+            'remote_address': None,
+            'network_latency': "High",
+            'wait_for_completion': True,
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        remotesystem_module_mock.conn.protection.get_remote_system_details = MagicMock(
+            return_value=dict(MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0]))
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock(
+            return_value=None)
+        remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.get_remote_system_details.assert_called_once()
+        assert remotesystem_module_mock.module.exit_json.call_args[1][
+            'remote_system_details']['data_network_latency'] == "High"
+
+    def test_modify_remotesystem_idempotency(self, remotesystem_module_mock):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': self.remote_system_sample_address,
+            'new_remote_address': self.remote_system_sample_address,
+            'description': None,
+            'network_latency': "Low",
+            'state': "present"
+        })
+        remotesystem_module_mock.module.params = module_args
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.modify_remote_system.assert_not_called()
+        assert remotesystem_module_mock.module.exit_json.call_args[1]['changed'] is False
+
     def test_add_remotesystem_remote_address_remote_name_response(self, remotesystem_module_mock):
         self.get_module_args.update({
             'remote_address': self.remote_system_sample_address,
@@ -163,3 +330,133 @@ class TestPowerstoreRemoteSystem():
             return_value=(None, None))
         remotesystem_module_mock.perform_module_operation()
         remotesystem_module_mock.protection.delete_remote_system.assert_called()
+
+    def test_modify_remotesystem_batch(self, remotesystem_module_mock):
+        remote_systems = [
+            self.get_batch_remote_system(remote_address=self.remote_system_sample_address,
+                                         network_latency="High")
+            for i in range(2)]
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock(
+            return_value={"id": "be0d099c-a6cf-44e8-88d7-9be80ccae369"})
+        remotesystem_module_mock.perform_module_operation()
+        assert remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address.call_count == 2
+        assert remotesystem_module_mock.conn.protection.modify_remote_system.call_count == 2
+        exit_args = remotesystem_module_mock.module.exit_json.call_args[1]
+        assert exit_args['changed'] is True
+        assert len(exit_args['results']) == 2
+
+    def get_batch_module_args(self, remote_systems):
+        module_args = dict(self.get_module_args)
+        module_args.update({
+            'remote_id': None,
+            'remote_name': None,
+            'remote_address': None,
+            'remote_systems': remote_systems,
+            'wait_for_completion': False,
+            'cache_ttl': 0,
+            'state': "present"
+        })
+        return module_args
+
+    def get_batch_remote_system(self, **kwargs):
+        remote_system = dict.fromkeys(
+            ['remote_id', 'remote_name', 'remote_user', 'remote_password', 'remote_address',
+             'new_remote_address', 'description', 'network_latency'])
+        remote_system['remote_port'] = 443
+        remote_system.update(kwargs)
+        return remote_system
+
+    def test_add_remotesystem_batch_single_lookup(self, remotesystem_module_mock):
+        remote_systems = [
+            self.get_batch_remote_system(remote_address=address, remote_user="admin",
+                                         remote_password="remote_password")
+            for address in ("xx.xx.xx.1", "xx.xx.xx.2")]
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=[])
+        remotesystem_module_mock.conn.protection.create_remote_system = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS[0])
+        remotesystem_module_mock.perform_module_operation()
+        assert remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address.call_count == 2
+        assert remotesystem_module_mock.conn.protection.create_remote_system.call_count == 2
+
+    def test_modify_remotesystem_batch_login(self, remotesystem_module_mock):
+        remote_systems = [
+            self.get_batch_remote_system(remote_address=address, network_latency="High")
+            for address in ("xx.xx.xx.1", "xx.xx.xx.2")]
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        calls = []
+        auth_manager = MagicMock()
+        auth_manager.get_token_and_cookie = MagicMock(
+            side_effect=lambda: calls.append('login'))
+        remotesystem_module_mock.provisioning.client.auth_manager = auth_manager
+        remotesystem_module_mock.provisioning.server_ip = "xx.xx.xx.xx:443"
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            side_effect=lambda address: calls.append(address) or MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock()
+        remotesystem_module_mock.perform_module_operation()
+        auth_manager.set_host.assert_called_once_with("xx.xx.xx.xx:443")
+        assert calls[0] == 'login'
+        assert sorted(calls[1:]) == ["xx.xx.xx.1", "xx.xx.xx.2"]
+
+    def test_modify_remotesystem_batch_lookup_exception(self, remotesystem_module_mock):
+        MockApiException.HTTP_ERR = "1"
+        MockApiException.err_code = "1"
+        MockApiException.status_code = "500"
+        remote_systems = [
+            self.get_batch_remote_system(remote_address=address, network_latency="High")
+            for address in ("xx.xx.xx.1", "xx.xx.xx.2", "xx.xx.xx.3")]
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            side_effect=[MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS, MockApiException, MockApiException])
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock()
+        remotesystem_module_mock.module.fail_json = MagicMock(side_effect=SystemExit)
+        with pytest.raises(SystemExit):
+            remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.module.fail_json.assert_called_once()
+        remotesystem_module_mock.conn.protection.modify_remote_system.assert_not_called()
+
+    def test_modify_remotesystem_batch_partial_failure(self, remotesystem_module_mock):
+        MockApiException.HTTP_ERR = "1"
+        MockApiException.err_code = "1"
+        MockApiException.status_code = "500"
+        remote_systems = [
+            self.get_batch_remote_system(remote_address=address, network_latency="High")
+            for address in ("xx.xx.xx.1", "xx.xx.xx.2", "xx.xx.xx.3")]
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            return_value=MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock(
+            side_effect=[{"id": "be0d099c-a6cf-44e8-88d7-9be80ccae369"}, MockApiException])
+        remotesystem_module_mock.module.fail_json = MagicMock(side_effect=SystemExit)
+        with pytest.raises(SystemExit):
+            remotesystem_module_mock.perform_module_operation()
+        assert remotesystem_module_mock.conn.protection.modify_remote_system.call_count == 2
+        fail_args = remotesystem_module_mock.module.fail_json.call_args[1]
+        assert fail_args['changed'] is True
+        assert len(fail_args['results']) == 1
+        assert fail_args['results'][0]['job_details'] == {"id": "be0d099c-a6cf-44e8-88d7-9be80ccae369"}
+
+    def test_modify_remotesystem_batch_invalid_params(self, remotesystem_module_mock):
+        remote_systems = [
+            self.get_batch_remote_system(remote_address="xx.xx.xx.1", network_latency="High"),
+            self.get_batch_remote_system(remote_address="xx.xx.xx.2", remote_name="xxx")]
+
+        def get_remote_system_by_mgmt_address(address):
+            if address == "xx.xx.xx.1":
+                return MockRemoteSystemApi.REMOTE_SYSTEM_DETAILS
+            return []
+        remotesystem_module_mock.module.params = self.get_batch_module_args(remote_systems)
+        remotesystem_module_mock.conn.protection.get_remote_system_by_mgmt_address = MagicMock(
+            side_effect=get_remote_system_by_mgmt_address)
+        remotesystem_module_mock.conn.protection.modify_remote_system = MagicMock()
+        remotesystem_module_mock.module.fail_json = MagicMock(side_effect=SystemExit)
+        with pytest.raises(SystemExit):
+            remotesystem_module_mock.perform_module_operation()
+        remotesystem_module_mock.conn.protection.modify_remote_system.assert_not_called()
+        fail_args = remotesystem_module_mock.module.fail_json.call_args[1]
+        assert "cannot be passed during creation" in fail_args['msg']
+        assert 'results' not in fail_args